@@ -1,4 +1,6 @@
+import functools
 import math
+import typing as t
 import uuid
 
 from PyQt6 import QtCore, QtGui, QtWidgets, uic
@@ -7,12 +9,14 @@ from main.simulation.objects.box import Box
 from main.simulation.objects.simulation_object import SimulationObject
 from main.simulation.sensor import SimulationSensor
 from main.simulation.simulation import DEFAULT_DT, DEFAULT_DX, MU_0, Simulation
+from main.simulation.simulation_backend import SimulationBackend
 from main.simulation.simulation_params import SimulationParams
 from main.simulation.sources.cosine_source import CosineSource
 from main.simulation.sources.simulation_source import SimulationSource
 from main.simulation.sources.sine_source import SineSource
 from main.simulation_job import SimulationJob
 from main.widgets.add_simulation_item_button import AddSimulationItemButton
+from main.widgets.expand_checkbox import ExpandCheckbox
 from main.widgets.float_tooltip_spinbox import FloatTooltipSpinbox
 from main.widgets.object_inspector import ObjectInspector
 from main.widgets.sensor_inspector import SensorInspector
@@ -20,6 +24,7 @@ from main.widgets.sensor_view import SensorView
 from main.widgets.simulation_control_button import SimulationControlButton
 from main.widgets.simulation_render_area import SimulationRenderArea
 from main.widgets.source_inspector import SourceInspector
+from main.widgets.visibility_checkbox import VisibilityCheckbox
 
 MAIN_WINDOW_UI_FILEPATH = './ui/main_window.ui'
 DATA_ROLE = QtCore.Qt.ItemDataRole.UserRole + 2137
@@ -46,6 +51,7 @@ class UI(QtWidgets.QMainWindow):
         self._sensor_counter = 0
         self._sensor_widgets = dict[uuid.UUID, SensorView]()
         self._simulation_job: SimulationJob | None = None
+        self._simulation_thread: QtCore.QThread | None = None
 
         # widgets
         self.simulation_tab: QtWidgets.QTabWidget
@@ -120,16 +126,20 @@ class UI(QtWidgets.QMainWindow):
         self.sensor_inspector.sensor_params_changed.connect(self._sensor_params_changed_cb)
 
         self.show_objects_input: QtWidgets.QCheckBox
-        self.show_objects_input.checkStateChanged.connect(self._show_objects_checkbox_changed_cb)
+        self.show_objects_input.checkStateChanged.connect(
+            functools.partial(self._toggle_overlay, 'show_objects', self.show_objects_input))
 
         self.show_sources_input: QtWidgets.QCheckBox
-        self.show_sources_input.checkStateChanged.connect(self._show_sources_checkbox_changed_cb)
+        self.show_sources_input.checkStateChanged.connect(
+            functools.partial(self._toggle_overlay, 'show_sources', self.show_sources_input))
 
         self.show_pml_input: QtWidgets.QCheckBox
-        self.show_pml_input.checkStateChanged.connect(self._show_pml_input_cb)
+        self.show_pml_input.checkStateChanged.connect(
+            functools.partial(self._toggle_overlay, 'draw_pml', self.show_pml_input))
 
         self.show_sensors_input: QtWidgets.QCheckBox
-        self.show_sensors_input.checkStateChanged.connect(self._show_sensors_checkbox_changed_cb)
+        self.show_sensors_input.checkStateChanged.connect(
+            functools.partial(self._toggle_overlay, 'show_sensors', self.show_sensors_input))
 
         self.steps_per_render_input: QtWidgets.QSpinBox
         self.current_frame_label: QtWidgets.QLabel
@@ -199,7 +209,6 @@ class UI(QtWidgets.QMainWindow):
         assert tab_layout is not None
 
         tab_layout.replaceWidget(self.current_inspector_widget, new_widget)
-        tab_layout.update()
 
         self.current_inspector_widget.hide()
         new_widget.show()
@@ -222,6 +231,10 @@ class UI(QtWidgets.QMainWindow):
         self._object_counter += 1
         return f'Object {self._object_counter}'
 
+    def _toggle_overlay(self, attr: str, checkbox: QtWidgets.QCheckBox) -> None:
+        setattr(self.simulation_render_area, attr, checkbox.isChecked())
+        self.simulation_render_area.draw(do_full_redraw=True)
+
     def _get_current_tab_list(self) -> QtWidgets.QListWidget:
         if self.lists_tab.currentIndex() == 0:
             return self.sources_list
@@ -266,11 +279,6 @@ class UI(QtWidgets.QMainWindow):
         widget.show()
         self.sensors_area_layout.update()
 
-    @QtCore.pyqtSlot()
-    def _show_sensors_checkbox_changed_cb(self) -> None:
-        self.simulation_render_area.show_sensors = self.show_sensors_input.isChecked()
-        self.simulation_render_area.draw(do_full_redraw=True)
-
     @QtCore.pyqtSlot()
     def _simulation_items_list_changed_cb(self) -> None:
         index = self.lists_tab.currentIndex()
@@ -293,15 +301,23 @@ class UI(QtWidgets.QMainWindow):
 
     @QtCore.pyqtSlot()
     def _sensor_params_changed_cb(self) -> None:
+        item = self.sensors_list.currentItem()
+        if item is not None:
+            sensor_id: uuid.UUID = item.data(DATA_ROLE)
+            self._simulation.update_sensor(sensor_id)
+
         if self.simulation_render_area.show_sensors and self.simulation_render_area.draw_simulation:
             self.simulation_render_area.draw(do_full_redraw=True)
 
     @QtCore.pyqtSlot()
     def _source_params_changed_cb(self) -> None:
-        item = self.sources_list.currentItem()
-        if item is not None:
-            source_id: uuid.UUID = item.data(DATA_ROLE)
-            self._simulation.update_source(source_id)
+        # throttled edits may arrive after the selection already moved on, so the edited
+        # source is taken from the inspector rather than from the list
+        source = self.source_inspector.source
+        for (source_id, simulation_source) in self._simulation.sources.items():
+            if simulation_source is source:
+                self._simulation.update_source(source_id)
+                break
 
         if self.simulation_render_area.show_sources and self.simulation_render_area.draw_simulation:
             self.simulation_render_area.draw(do_full_redraw=True)
@@ -312,8 +328,7 @@ class UI(QtWidgets.QMainWindow):
         if item is None:
             return
 
-        item_id = item.data(DATA_ROLE)
-        assert isinstance(item_id, uuid.UUID)
+        item_id = t.cast(uuid.UUID, item.data(DATA_ROLE))
 
         self.sensor_inspector.set_sensor(self._simulation.sensors[item_id])
         self._change_inspector_widget(self.sensor_inspector)
@@ -324,8 +339,7 @@ class UI(QtWidgets.QMainWindow):
         if item is None:
             return
 
-        item_id = item.data(DATA_ROLE)
-        assert isinstance(item_id, uuid.UUID)
+        item_id = t.cast(uuid.UUID, item.data(DATA_ROLE))
 
         self.source_inspector.set_source(self._simulation.sources[item_id])
         self._change_inspector_widget(self.source_inspector)
@@ -336,8 +350,7 @@ class UI(QtWidgets.QMainWindow):
         if item is None:
             return
 
-        item_id = item.data(DATA_ROLE)
-        assert isinstance(item_id, uuid.UUID)
+        item_id = t.cast(uuid.UUID, item.data(DATA_ROLE))
 
         self.object_inspector.set_object(self._simulation.objects[item_id])
         self._change_inspector_widget(self.object_inspector)
@@ -354,21 +367,6 @@ class UI(QtWidgets.QMainWindow):
     def _pml_order_input_changed_cb(self) -> None:
         self._simulation.set_pml_params(order=self.pml_order_input.value())
 
-    @QtCore.pyqtSlot()
-    def _show_pml_input_cb(self) -> None:
-        self.simulation_render_area.draw_pml = self.show_pml_input.isChecked()
-        self.simulation_render_area.draw(do_full_redraw=True)
-
-    @QtCore.pyqtSlot()
-    def _show_sources_checkbox_changed_cb(self) -> None:
-        self.simulation_render_area.show_sources = self.show_sources_input.isChecked()
-        self.simulation_render_area.draw(do_full_redraw=True)
-
-    @QtCore.pyqtSlot()
-    def _show_objects_checkbox_changed_cb(self) -> None:
-        self.simulation_render_area.show_objects = self.show_objects_input.isChecked()
-        self.simulation_render_area.draw(do_full_redraw=True)
-
     @QtCore.pyqtSlot()
     def _clear_button_clicked_cb(self) -> None:
         self._simulation.reset()
@@ -380,13 +378,16 @@ class UI(QtWidgets.QMainWindow):
 
         draw_time = 0.0
         if current_tab == SIMULATION_TAB_INDEX:
-            if self._simulation.current_frame % self.steps_per_render_input.value() == 0:
-                self.simulation_render_area.draw()
+            # the job emits once per rendered batch of frames
+            self.simulation_render_area.draw()
 
             draw_time = self.simulation_render_area.draw_time_ms
         elif current_tab == SENSORS_TAB_INDEX:
             for (sensor_id, sensor) in self._simulation.sensors.items():
                 widget = self._sensor_widgets[sensor_id]
+                if not widget.is_expanded:
+                    continue
+
                 widget.update_sensor_data(sensor.data, self._simulation.time_array)
 
                 draw_time += widget.draw_time_ms
@@ -444,17 +445,29 @@ class UI(QtWidgets.QMainWindow):
 
         if is_simulation_running:
             self._simulation_job.stop() # type: ignore[union-attr]
+            self._simulation_thread.quit() # type: ignore[union-attr]
+            self._simulation_thread.wait() # type: ignore[union-attr]
+
             self._simulation_job = None
+            self._simulation_thread = None
         else:
-            self._simulation_job = SimulationJob(self._simulation)
-            self._simulation_job.frame_ready.connect(self._simulation_frame_ready_cb)
-            self._simulation_job.start()
+            self._simulation_thread = QtCore.QThread()
+            self._simulation_job = SimulationJob(self._simulation, self.steps_per_render_input.value())
+            self._simulation_job.moveToThread(self._simulation_thread)
+            self._simulation_job.frame_ready.connect(
+                self._simulation_frame_ready_cb,
+                QtCore.Qt.ConnectionType.QueuedConnection)
+            self._simulation_thread.started.connect(self._simulation_job.run)
+            self._simulation_thread.start()
 
             self.show_pml_input.setChecked(False)
 
         self.clear_button.setEnabled(is_simulation_running)
         self.steps_per_render_input.setEnabled(is_simulation_running)
         self.show_pml_input.setEnabled(is_simulation_running)
+        # the simulation arrays are reallocated on resize, which must not happen under the running job
+        self.grid_size_x_input.setEnabled(is_simulation_running)
+        self.grid_size_y_input.setEnabled(is_simulation_running)
         self.simulate_button.set_state(not is_simulation_running)
 
     @QtCore.pyqtSlot(uuid.UUID)
@@ -468,8 +481,7 @@ class UI(QtWidgets.QMainWindow):
         if current_tab == SOURCES_LIST_TAB_INDEX:
             current_item = self.sources_list.currentItem()
             if current_item is not None:
-                item_id = current_item.data(DATA_ROLE)
-                assert isinstance(item_id, uuid.UUID)
+                item_id = t.cast(uuid.UUID, current_item.data(DATA_ROLE))
 
                 self._simulation.remove_source(item_id)
                 self.sources_list.takeItem(self.sources_list.row(current_item))
@@ -481,8 +493,7 @@ class UI(QtWidgets.QMainWindow):
         elif current_tab == OBJECTS_LIST_TAB_INDEX:
             current_item = self.objects_list.currentItem()
             if current_item is not None:
-                item_id = current_item.data(DATA_ROLE)
-                assert isinstance(item_id, uuid.UUID)
+                item_id = t.cast(uuid.UUID, current_item.data(DATA_ROLE))
 
                 self._simulation.remove_object(item_id)
                 self.objects_list.takeItem(self.objects_list.row(current_item))
@@ -492,7 +503,7 @@ class UI(QtWidgets.QMainWindow):
                     new_object = self._simulation.objects[current_item.data(DATA_ROLE)] # type: ignore
                     self.object_inspector.set_object(new_object)
 
-        self.simulation_render_area.draw()
+        self.simulation_render_area.draw(do_full_redraw=True)
 
     @QtCore.pyqtSlot(object)
     def _sim_params_changed(self, params: SimulationParams) -> None:
@@ -509,7 +520,7 @@ class UI(QtWidgets.QMainWindow):
         self.pml_layers_input.setValue(params.pml_layers)
         self.pml_layers_input.setMaximum(math.floor(min(params.grid_size) / 2))
 
-        self.simulation_render_area.draw()
+        self.simulation_render_area.draw(do_full_redraw=True)
 
 def _input_greater_than_zero(_input: float | int) -> bool:
     return _input > 0
@@ -523,9 +534,12 @@ if __name__ == '__main__':
             500,
             1e-8,
             25,
-            3)
+            3,
+            SimulationBackend.AUTO)
 
     app = QtWidgets.QApplication([])
+    # set before any widget is created so it is parsed once and nothing has to be restyled
+    app.setStyleSheet(VisibilityCheckbox.get_stylesheet() + ExpandCheckbox.get_stylesheet())
     ui = UI(simulation)
 
     ui.showMaximized()
@@ -0,0 +1,105 @@
+import functools
+
+import numpy as np
+
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+HAS_CUPY = cupy is not None
+BLOCK_SIZE = 16
+
+_KERNELS_SOURCE = r'''
+extern "C" __global__
+void update_h(const float* ez, float* hx, float* hy, float pml_a, const float* pml_b_am, int rows, int cols)
+{
+    int j = blockDim.x * blockIdx.x + threadIdx.x;
+    int i = blockDim.y * blockIdx.y + threadIdx.y;
+    if (i < 1 || i >= rows - 1 || j < 1 || j >= cols - 1)
+        return;
+
+    int idx = i * cols + j;
+    float ez_ij = ez[idx];
+
+    hy[idx] = pml_a * hy[idx] + pml_b_am[idx] * (ez[idx + cols] - ez_ij);
+    hx[idx] = pml_a * hx[idx] - pml_b_am[idx] * (ez[idx + 1] - ez_ij);
+}
+
+extern "C" __global__
+void update_e(float* ez, const float* hx, const float* hy, const float* pml_c, const float* pml_d_ae, int rows, int cols)
+{
+    int j = blockDim.x * blockIdx.x + threadIdx.x;
+    int i = blockDim.y * blockIdx.y + threadIdx.y;
+    if (i < 2 || i >= rows || j < 2 || j >= cols)
+        return;
+
+    int idx = i * cols + j;
+    ez[idx] = pml_c[idx] * ez[idx] + pml_d_ae[idx] * (hy[idx] - hy[idx - cols] - hx[idx] + hx[idx - 1]);
+}
+'''
+
+@functools.cache
+def is_available() -> bool:
+    if not HAS_CUPY:
+        return False
+
+    # cupy can be installed on machines without a usable driver or device, which only shows up here
+    try:
+        return cupy.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+@functools.cache
+def _get_kernels() -> tuple:
+    # compiled on first use, so importing this module never touches the GPU
+    module = cupy.RawModule(code=_KERNELS_SOURCE)
+    return (module.get_function('update_h'), module.get_function('update_e'))
+
+def fdtd_steps(ez,
+               hx,
+               hy,
+               pml_a,
+               pml_b_am,
+               pml_c,
+               pml_d_ae,
+               source_rows: np.ndarray,
+               source_cols: np.ndarray,
+               source_data: np.ndarray,
+               sensor_rows: np.ndarray,
+               sensor_cols: np.ndarray,
+               sensor_data: np.ndarray,
+               steps: int) -> None:
+    # field and coefficient arrays are expected to be C-contiguous float32 cupy arrays, pml_a is a scalar,
+    # source and sensor tables are small so they are transferred on every call
+    update_h, update_e = _get_kernels()
+
+    rows, cols = ez.shape
+    grid = ((cols + BLOCK_SIZE - 1) // BLOCK_SIZE, (rows + BLOCK_SIZE - 1) // BLOCK_SIZE)
+    block = (BLOCK_SIZE, BLOCK_SIZE)
+    shape_args = (np.int32(rows), np.int32(cols))
+
+    device_source_rows = cupy.asarray(source_rows)
+    device_source_cols = cupy.asarray(source_cols)
+    device_source_data = cupy.asarray(source_data)
+    device_sensor_rows = cupy.asarray(sensor_rows)
+    device_sensor_cols = cupy.asarray(sensor_cols)
+    device_sensor_data = cupy.empty(sensor_data.shape, dtype=sensor_data.dtype)
+
+    has_sources = source_rows.shape[0] > 0
+    has_sensors = sensor_rows.shape[0] > 0
+
+    for step in range(steps):
+        update_h(grid, block, (ez, hx, hy, np.float32(pml_a), pml_b_am, *shape_args))
+        update_e(grid, block, (ez, hx, hy, pml_c, pml_d_ae, *shape_args))
+
+        if has_sources:
+            ez[device_source_rows, device_source_cols] = device_source_data[step]
+
+        if has_sensors:
+            device_sensor_data[step] = ez[device_sensor_rows, device_sensor_cols]
+
+    sensor_data[...] = cupy.asnumpy(device_sensor_data)
+
+def to_host(array, out: np.ndarray | None = None) -> np.ndarray:
+    return cupy.asnumpy(array, out=out)
@@ -0,0 +1,14 @@
+import typing as t
+
+
+class IntFieldCache:
+    # fields whose integer value is cached in a matching `<name>_int` field
+    _int_fields: t.ClassVar[tuple[str, ...]] = ()
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        # zero-argument super() is not usable in the slotted dataclasses deriving from this
+        object.__setattr__(self, name, value)
+        if name in self._int_fields:
+            object.__setattr__(self, f'{name}_int', int(value))
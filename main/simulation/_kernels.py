@@ -0,0 +1,122 @@
+import functools
+import typing as t
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+HAS_NUMBA = numba is not None
+prange = numba.prange if HAS_NUMBA else range
+
+def fdtd_steps_numpy(ez: np.ndarray,
+                     hx: np.ndarray,
+                     hy: np.ndarray,
+                     pml_a: float,
+                     pml_b_am: np.ndarray,
+                     pml_c: np.ndarray,
+                     pml_d_ae: np.ndarray,
+                     source_rows: np.ndarray,
+                     source_cols: np.ndarray,
+                     source_data: np.ndarray,
+                     sensor_rows: np.ndarray,
+                     sensor_cols: np.ndarray,
+                     sensor_data: np.ndarray,
+                     steps: int,
+                     scratch: np.ndarray) -> None:
+    # fallback used when numba is not available, every operation writes into preallocated
+    # buffers so no temporary arrays are created per step
+    inner = (slice(1, -1), slice(1, -1))
+    shifted = (slice(2, None), slice(2, None))
+
+    ez_inner = ez[inner]
+    ez_shifted = ez[shifted]
+    hx_inner = hx[inner]
+    hy_inner = hy[inner]
+    pml_b_am_inner = pml_b_am[inner]
+    pml_c_shifted = pml_c[shifted]
+    pml_d_ae_shifted = pml_d_ae[shifted]
+
+    # flat indices skip the two-dimensional fancy indexing machinery on every step
+    cols = ez.shape[1]
+    ez_flat = ez.reshape(-1)
+    source_indices = source_rows.astype(np.intp) * cols + source_cols
+    sensor_indices = sensor_rows.astype(np.intp) * cols + sensor_cols
+
+    for step in range(steps):
+        np.subtract(ez[2:, 1:-1], ez_inner, out=scratch)
+        np.multiply(scratch, pml_b_am_inner, out=scratch)
+        np.multiply(hy_inner, pml_a, out=hy_inner)
+        np.add(hy_inner, scratch, out=hy_inner)
+
+        np.subtract(ez[1:-1, 2:], ez_inner, out=scratch)
+        np.multiply(scratch, pml_b_am_inner, out=scratch)
+        np.multiply(hx_inner, pml_a, out=hx_inner)
+        np.subtract(hx_inner, scratch, out=hx_inner)
+
+        np.subtract(hy[2:, 2:], hy[1:-1, 2:], out=scratch)
+        np.subtract(scratch, hx[2:, 2:], out=scratch)
+        np.add(scratch, hx[2:, 1:-1], out=scratch)
+        np.multiply(scratch, pml_d_ae_shifted, out=scratch)
+        np.multiply(ez_shifted, pml_c_shifted, out=ez_shifted)
+        np.add(ez_shifted, scratch, out=ez_shifted)
+
+        np.put(ez_flat, source_indices, source_data[step])
+        np.take(ez_flat, sensor_indices, out=sensor_data[step])
+
+@functools.lru_cache(maxsize=8)
+def get_fdtd_steps(rows: int, cols: int) -> t.Callable[..., None]:
+    # grid shape is baked into the kernel as compile time constants, which allows
+    # the compiler to vectorize the inner loops more aggressively
+    def fdtd_steps(ez: np.ndarray,
+                   hx: np.ndarray,
+                   hy: np.ndarray,
+                   pml_a: float,
+                   pml_b_am: np.ndarray,
+                   pml_c: np.ndarray,
+                   pml_d_ae: np.ndarray,
+                   source_rows: np.ndarray,
+                   source_cols: np.ndarray,
+                   source_data: np.ndarray,
+                   sensor_rows: np.ndarray,
+                   sensor_cols: np.ndarray,
+                   sensor_data: np.ndarray,
+                   steps: int) -> None:
+        for step in range(steps):
+            # inner loops run along the contiguous axis, with row views hoisted out of them
+            for i in prange(1, rows - 1):
+                ez_row = ez[i]
+                ez_next_row = ez[i + 1]
+                hx_row = hx[i]
+                hy_row = hy[i]
+                pml_b_am_row = pml_b_am[i]
+                for j in range(1, cols - 1):
+                    ez_ij = ez_row[j]
+
+                    hy_row[j] = pml_a * hy_row[j] + pml_b_am_row[j] * (ez_next_row[j] - ez_ij)
+                    hx_row[j] = pml_a * hx_row[j] - pml_b_am_row[j] * (ez_row[j + 1] - ez_ij)
+
+            # electric field has to be updated only after all magnetic field values are ready
+            for i in prange(2, rows):
+                ez_row = ez[i]
+                hx_row = hx[i]
+                hy_row = hy[i]
+                hy_prev_row = hy[i - 1]
+                pml_c_row = pml_c[i]
+                pml_d_ae_row = pml_d_ae[i]
+                for j in range(2, cols):
+                    ez_row[j] = pml_c_row[j] * ez_row[j] + pml_d_ae_row[j] * (hy_row[j] - hy_prev_row[j] - hx_row[j] + hx_row[j - 1])
+
+            for i in range(source_rows.shape[0]):
+                ez[source_rows[i], source_cols[i]] = source_data[step, i]
+
+            for i in range(sensor_rows.shape[0]):
+                sensor_data[step, i] = ez[sensor_rows[i], sensor_cols[i]]
+
+    if HAS_NUMBA:
+        # on-disk cache is keyed by the captured shape, so each grid size is compiled only once
+        return numba.njit(parallel=True, fastmath=True, boundscheck=False, nogil=True, cache=True)(fdtd_steps)
+
+    return fdtd_steps
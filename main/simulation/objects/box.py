@@ -1,36 +1,46 @@
 import dataclasses
+import typing as t
 
 import numpy as np
 from matplotlib.axes import Axes
-from matplotlib.patches import Rectangle
+from matplotlib.patches import Patch, Rectangle
 
 from main.simulation.objects.simulation_object import SimulationObject
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Box(SimulationObject):
+    _int_fields: t.ClassVar[tuple[str, ...]] = ('pos_x', 'pos_y', 'width', 'height')
+
     width: float
     height: float
+    width_int: int = dataclasses.field(init=False, repr=False, compare=False)
+    height_int: int = dataclasses.field(init=False, repr=False, compare=False)
+
+    def draw(self, axes: Axes) -> Patch:
+        return axes.add_patch(Rectangle((self.pos_x, self.pos_y), self.width, self.height, fill=False, edgecolor='black'))
 
-    def draw(self, axes: Axes) -> None:
-        axes.add_patch(Rectangle((self.pos_x, self.pos_y), self.width, self.height, fill=False, edgecolor='black'))
+    def update_patch(self, patch: Patch) -> None:
+        assert isinstance(patch, Rectangle)
 
-    def place(self, permittivity_array: np.ndarray, permeability_array: np.ndarray) -> None:
-        permittivity_array[self.pos_y_int:self.pos_y_int + self.height_int, self.pos_x_int:self.pos_x_int + self.width_int] = self.permittivity
-        permeability_array[self.pos_y_int:self.pos_y_int + self.height_int, self.pos_x_int:self.pos_x_int + self.width_int] = self.permeability
+        patch.set_bounds(self.pos_x, self.pos_y, self.width, self.height)
 
-    def erase(self,
+    def place(self,
               permittivity_array: np.ndarray,
               permeability_array: np.ndarray,
-              default_permittivity: float,
-              default_permeability: float) -> None:
-        permittivity_array[self.pos_y_int:self.pos_y_int + self.height_int, self.pos_x_int:self.pos_x_int + self.width_int] = default_permittivity
-        permeability_array[self.pos_y_int:self.pos_y_int + self.height_int, self.pos_x_int:self.pos_x_int + self.width_int] = default_permeability
+              bounds: tuple[slice, slice] | None = None) -> None:
+        region = self.region
+        if bounds is not None:
+            region = (
+                slice(max(region[0].start, bounds[0].start), min(region[0].stop, bounds[0].stop)),
+                slice(max(region[1].start, bounds[1].start), min(region[1].stop, bounds[1].stop)))
 
-    @property
-    def width_int(self) -> int:
-        return int(self.width)
+        permittivity_array[region] = self.permittivity
+        permeability_array[region] = self.permeability
 
     @property
-    def height_int(self) -> int:
-        return int(self.height)
+    def region(self) -> tuple[slice, slice]:
+        # basic slicing is used on purpose, it is much faster than scattering through flat indices
+        pos_x = self.pos_x_int
+        pos_y = self.pos_y_int
+        return (slice(pos_y, pos_y + self.height_int), slice(pos_x, pos_x + self.width_int))
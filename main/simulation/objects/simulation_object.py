@@ -1,39 +1,41 @@
 import abc
 import dataclasses
+import typing as t
 
 import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.patches import Patch
 
+from main.simulation._int_cache import IntFieldCache
+
+
+@dataclasses.dataclass(slots=True)
+class SimulationObject(IntFieldCache, abc.ABC):
+    _int_fields: t.ClassVar[tuple[str, ...]] = ('pos_x', 'pos_y')
 
-@dataclasses.dataclass
-class SimulationObject(abc.ABC):
     permittivity: float
     permeability: float
     pos_x: float
     pos_y: float
+    pos_x_int: int = dataclasses.field(init=False, repr=False, compare=False)
+    pos_y_int: int = dataclasses.field(init=False, repr=False, compare=False)
 
     @abc.abstractmethod
-    def draw(self, axes: Axes) -> None:
+    def draw(self, axes: Axes) -> Patch:
         pass
 
     @abc.abstractmethod
-    def place(self,
-              permittivity_array: np.ndarray,
-              permeability_array: np.ndarray) -> None:
+    def update_patch(self, patch: Patch) -> None:
         pass
 
     @abc.abstractmethod
-    def erase(self,
+    def place(self,
               permittivity_array: np.ndarray,
               permeability_array: np.ndarray,
-              default_permittivity: float,
-              default_permeability: float) -> None:
+              bounds: tuple[slice, slice] | None = None) -> None:
         pass
 
     @property
-    def pos_x_int(self) -> int:
-        return int(self.pos_x)
-
-    @property
-    def pos_y_int(self) -> int:
-        return int(self.pos_y)
+    @abc.abstractmethod
+    def region(self) -> tuple[slice, slice]:
+        pass
@@ -6,7 +6,8 @@ import numpy as np
 @dataclasses.dataclass
 class PMLProfile:
     data: np.ndarray
-    a: np.ndarray
-    b: np.ndarray
+    # magnetic field coefficients are uniform across the whole grid
+    a: float
+    b: float
     c: np.ndarray
     d: np.ndarray
@@ -1,26 +1,25 @@
 import dataclasses
+import typing as t
 
 import numpy as np
 
+from main.simulation._int_cache import IntFieldCache
+
 
 @dataclasses.dataclass(slots=True)
-class SimulationSensor:
+class SimulationSensor(IntFieldCache):
+    _int_fields: t.ClassVar[tuple[str, ...]] = ('pos_x', 'pos_y')
+
     pos_x: float
     pos_y: float
     data: np.ndarray | None = dataclasses.field(init=False, default=None)
+    pos_x_int: int = dataclasses.field(init=False, repr=False, compare=False)
+    pos_y_int: int = dataclasses.field(init=False, repr=False, compare=False)
 
     @property
     def pos(self) -> tuple[float, float]:
         return (self.pos_x, self.pos_y)
 
-    @property
-    def pos_x_int(self) -> int:
-        return int(self.pos_x)
-
-    @property
-    def pos_y_int(self) -> int:
-        return int(self.pos_y)
-
     @property
     def pos_int(self) -> tuple[int, int]:
         return (self.pos_x_int, self.pos_y_int)
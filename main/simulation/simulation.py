@@ -1,12 +1,16 @@
+import math
 import time
+import typing as t
 import uuid
 
 import numpy as np
 from PyQt6 import QtCore
 
+from main.simulation import _cuda_kernels, _kernels
 from main.simulation.objects.simulation_object import SimulationObject
 from main.simulation.pml_profile import PMLProfile
 from main.simulation.sensor import SimulationSensor
+from main.simulation.simulation_backend import SimulationBackend
 from main.simulation.simulation_params import SimulationParams
 from main.simulation.sources.simulation_source import SimulationSource
 
@@ -15,10 +19,17 @@ EPS_0 = 8.854 * 1e-12
 ETA = np.sqrt(MU_0 / EPS_0)
 C = 1 / np.sqrt(EPS_0 * MU_0)
 S = 1 / np.sqrt(2)
+# background conductivity of the whole grid, PML layers are added on top of it
+SIGMA_0 = 4e-4
 
 DEFAULT_DX = 3e-3
 DEFAULT_DT = S * DEFAULT_DX / C
 
+FIELD_DTYPE = np.float32
+
+# smaller grids are faster on CPU, as kernel launches and transfers dominate there
+CUDA_AUTO_MIN_GRID_CELLS = 1024 * 1024
+
 class Simulation(QtCore.QObject):
     params_changed = QtCore.pyqtSignal(object)
 
@@ -30,9 +41,26 @@ class Simulation(QtCore.QObject):
                  grid_size_y: int,
                  pml_reflectivity: float,
                  pml_layers: int,
-                 pml_order: int) -> None:
+                 pml_order: int,
+                 backend: SimulationBackend = SimulationBackend.CPU,
+                 dtype: type[np.floating] = FIELD_DTYPE) -> None:
         super().__init__()
 
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError('Simulation field dtype has to be a floating point type')
+
+        if backend == SimulationBackend.CUDA and not _cuda_kernels.HAS_CUPY:
+            raise RuntimeError('CUDA simulation backend requires cupy to be installed')
+
+        if backend == SimulationBackend.CUDA and not _cuda_kernels.is_available():
+            raise RuntimeError('CUDA simulation backend requires a CUDA capable device')
+
+        if backend == SimulationBackend.CUDA and dtype != np.float32:
+            raise ValueError('CUDA simulation backend supports only float32 fields')
+
+        self._backend = backend
+        self._dtype = dtype
+
         self._dt = dt
         self._dx = dx
         self._max_time_steps = max_time_steps
@@ -41,6 +69,8 @@ class Simulation(QtCore.QObject):
         self._pml_reflectivity = pml_reflectivity
         self._pml_layers = pml_layers
         self._pml_order = pml_order
+        self._active_backend: SimulationBackend
+        self._xp: t.Any
 
         self._current_frame = 0
         self._simulation_time = 0.0
@@ -48,17 +78,38 @@ class Simulation(QtCore.QObject):
         self._ez: np.ndarray
         self._hx: np.ndarray
         self._hy: np.ndarray
+        self._scratch: np.ndarray
+        self._ez_front: np.ndarray
+        self._ez_back: np.ndarray
         self._ae: np.ndarray
         self._am: np.ndarray
+        self._ae_scalar: np.floating
+        self._am_scalar: np.floating
+        self._pml_a: np.floating
+        self._pml_b_am: np.ndarray
+        self._pml_c: np.ndarray
+        self._pml_d_ae: np.ndarray
         self._time_array: np.ndarray
+        self._pml_lcp: np.ndarray
         self._pml_profile: PMLProfile
 
         self._sources = dict[uuid.UUID, SimulationSource]()
+        self._source_rows = np.empty((0, ), dtype=np.int32)
+        self._source_cols = np.empty((0, ), dtype=np.int32)
+        self._source_data = np.empty((max_time_steps, 0), dtype=self._dtype)
         self._objects = dict[uuid.UUID, SimulationObject]()
+        # regions last written by each object into material arrays
+        self._object_regions = dict[uuid.UUID, tuple[slice, slice]]()
         self._sensors = dict[uuid.UUID, SimulationSensor]()
+        self._sensor_rows = np.empty((0, ), dtype=np.int32)
+        self._sensor_cols = np.empty((0, ), dtype=np.int32)
+        self._sensor_data = np.empty((max_time_steps, 0), dtype=self._dtype)
 
-        self.reset()
+        self._select_active_backend()
+        self._update_allowance_scalars()
+        self._regenerate_pml_lcp()
         self._regenerate_pml_profile()
+        self.reset()
         self._regenerate_time_array()
 
     @property
@@ -73,6 +124,10 @@ class Simulation(QtCore.QObject):
     def current_frame(self) -> int:
         return self._current_frame
 
+    @property
+    def max_time_steps(self) -> int:
+        return self._max_time_steps
+
     @property
     def grid_size_x(self) -> int:
         return self._grid_size_x
@@ -85,6 +140,19 @@ class Simulation(QtCore.QObject):
     def grid_size(self) -> tuple[int, int]:
         return (self._grid_size_x, self._grid_size_y)
 
+    @property
+    def field_shape(self) -> tuple[int, int]:
+        # simulation arrays are indexed as [y, x]
+        return (self._grid_size_y, self._grid_size_x)
+
+    @property
+    def backend(self) -> SimulationBackend:
+        return self._active_backend
+
+    @property
+    def dtype(self) -> type[np.floating]:
+        return self._dtype
+
     @property
     def sources(self) -> dict[uuid.UUID, SimulationSource]:
         return self._sources
@@ -110,19 +178,27 @@ class Simulation(QtCore.QObject):
         return self._time_array
 
     def set_dx(self, dx: float, use_auto_dt: bool = False) -> None:
-        self._dx = dx
+        # UI emits value changes also when nothing changes, which would needlessly rebuild all arrays
+        if dx == self._dx and (not use_auto_dt or self._dt == _calculate_auto_dt(dx)):
+            return
 
-        self._regenerate_pml_profile()
-        self._update_allowance_arrays()
-        self._update_objects(erase_old=False)
+        self._dx = dx
 
         if use_auto_dt:
             self._set_dt(_calculate_auto_dt(self._dx), regenerate_pml=False)
 
+        self._update_allowance_scalars()
+        self._regenerate_pml_lcp()
+        self._regenerate_pml_profile()
+        self._rebuild_material_arrays()
         self.emit_params_changed_signal()
 
     def set_dt(self, dt: float) -> None:
+        if dt == self._dt:
+            return
+
         self._set_dt(dt, regenerate_pml=True)
+        self._rebuild_material_arrays()
         self.emit_params_changed_signal()
 
     def set_grid_size(self, x: int | None, y: int | None) -> None:
@@ -132,16 +208,18 @@ class Simulation(QtCore.QObject):
         if y is None:
             y = self._grid_size_y
 
+        if x == self._grid_size_x and y == self._grid_size_y:
+            return
+
         self._grid_size_x = x
         self._grid_size_y = y
 
-        grid_size = self.grid_size
-        self._hx.resize(grid_size)
-        self._hy.resize(grid_size)
-        self._ae.resize(grid_size)
-        self._am.resize(grid_size)
-
-        self._needs_allowance_arrays_update = True
+        # field layout changes completely, so previous simulation state cannot be kept
+        self._select_active_backend()
+        self._regenerate_pml_profile()
+        self._rebuild_source_tables()
+        self._rebuild_sensor_tables()
+        self.reset()
         self.emit_params_changed_signal()
 
     def set_pml_params(self,
@@ -150,107 +228,145 @@ class Simulation(QtCore.QObject):
                        order: int | None = None) -> None:
         params_changed = False
 
-        if reflectivity is not None:
+        if reflectivity is not None and reflectivity != self._pml_reflectivity:
             self._pml_reflectivity = reflectivity
             params_changed = True
 
-        if layers is not None:
+        if layers is not None and layers != self._pml_layers:
             self._pml_layers = layers
             params_changed = True
 
-        if order is not None:
+        if order is not None and order != self._pml_order:
             self._pml_order = order
             params_changed = True
 
         if params_changed:
+            self._regenerate_pml_lcp()
             self._regenerate_pml_profile()
+            self._update_coefficients()
             self.emit_params_changed_signal()
 
     def reset(self) -> None:
         self._current_frame = 0
 
-        grid_size = self.grid_size
-        self._ez = np.zeros(grid_size)
-        self._hx = np.zeros(grid_size)
-        self._hy = np.zeros(grid_size)
+        field_shape = self.field_shape
+        self._ez = self._xp.zeros(field_shape, dtype=self._dtype)
+        self._hx = self._xp.zeros(field_shape, dtype=self._dtype)
+        self._hy = self._xp.zeros(field_shape, dtype=self._dtype)
+        # frames are published through a pair of host buffers only once the previous frame was
+        # rendered, so readers never see a field that is being written by the simulation thread
+        self._ez_front = np.zeros(field_shape, dtype=self._dtype)
+        self._ez_back = np.zeros(field_shape, dtype=self._dtype)
+        # only used by the NumPy fallback of the FDTD kernel
+        self._scratch = np.empty((field_shape[0] - 2, field_shape[1] - 2), dtype=self._dtype)
         # we need to immediately update allowance to allow user to see changes after clicking reset
-        self._update_allowance_arrays()
-        self._update_objects(erase_old=False)
+        self._rebuild_material_arrays()
 
     def add_source(self, source: SimulationSource) -> uuid.UUID:
         source.calculate_data(self._time_array)
 
         source_id = uuid.uuid4()
         self._sources[source_id] = source
+        self._rebuild_source_tables()
 
         return source_id
 
     def add_sensor(self, sensor: SimulationSensor) -> uuid.UUID:
-        sensor.data = np.zeros((self._max_time_steps, ))
+        sensor.data = np.zeros((self._max_time_steps, ), dtype=self._dtype)
 
         sensor_id = uuid.uuid4()
         self._sensors[sensor_id] = sensor
+        self._rebuild_sensor_tables()
 
         return sensor_id
 
+    def update_sensor(self, sensor_id: uuid.UUID) -> None:
+        if sensor_id in self._sensors:
+            self._rebuild_sensor_tables()
+
     def update_source(self, source_id: uuid.UUID) -> None:
         source = self._sources.get(source_id, None)
         if source is not None:
             source.calculate_data(self._time_array)
+            self._rebuild_source_tables()
 
     def update_object(self, object_id: uuid.UUID) -> None:
         obj = self._objects.get(object_id, None)
         if obj is not None:
-            self._update_object(obj, erase_old=True)
+            old_region = self._object_regions[object_id]
+            self._object_regions[object_id] = obj.region
+            self._rebuild_material_region(_bounding_region(old_region, obj.region))
 
     def remove_source(self, source_id: uuid.UUID) -> None:
-        self._sources.pop(source_id, None)
+        if self._sources.pop(source_id, None) is not None:
+            self._rebuild_source_tables()
 
     def remove_object(self, object_id: uuid.UUID) -> None:
-        obj = self._objects.pop(object_id, None)
-        if obj is not None:
-            obj.erase(self._ae, self._am, self._dt / (self._dx * EPS_0), self._dt / (self._dx * MU_0))
+        if self._objects.pop(object_id, None) is not None:
+            self._rebuild_material_region(self._object_regions.pop(object_id))
 
     def add_object(self, obj: SimulationObject) -> uuid.UUID:
-        self._needs_allowance_arrays_update = True
-
         object_id = uuid.uuid4()
         self._objects[object_id] = obj
 
+        # new object is placed on top of existing ones, so only its own region has to be updated
+        region = obj.region
+        self._object_regions[object_id] = region
+        obj.place(self._ae, self._am)
+        self._update_coefficients_region(region)
+
         return object_id
 
     def simulate_frame(self) -> None:
-        start = time.perf_counter()
-
-        n1 = 1
-        n11 = 1
-        n2 = self._grid_size_y - 1
-        n21 = self._grid_size_x - 1
+        self.simulate_frames(1)
 
-        idx1 = (slice(n1, n2), slice(n11, n21))
-        idx2 = (slice(n1 + 1, n2 + 1), slice(n11 + 1, n21 + 1))
-
-        pml_a = self._pml_profile.a[idx1]
-        pml_b = self._pml_profile.b[idx1]
-
-        self._hy[idx1] = pml_a * self._hy[idx1] + pml_b * self._am[idx1] * (self._ez[n1 + 1:n2 + 1, n11:n21] - self._ez[idx1])
-        self._hx[idx1] = pml_a * self._hx[idx1] - pml_b * self._am[idx1] * (self._ez[n1:n2, n11 + 1:n21 + 1] - self._ez[idx1])
-        self._ez[idx2] = self._pml_profile.c[idx2] * self._ez[idx2] + self._pml_profile.d[idx2] * self._ae[idx2] * (self._hy[idx2] - self._hy[n1:n2, n11 + 1:n21 + 1] - self._hx[idx2] + self._hx[n1 + 1:n2 + 1, n11:n21])
+    def simulate_frames(self, count: int) -> None:
+        start = time.perf_counter()
 
-        # update sources
-        for source in self._sources.values():
-            self._ez[source.pos_y_int, source.pos_x_int] = source.data[self._current_frame]
+        first_frame = self._current_frame
+        last_frame = min(first_frame + count, self._max_time_steps)
+        count = last_frame - first_frame
+        if count <= 0:
+            return
+
+        args = (
+            self._ez,
+            self._hx,
+            self._hy,
+            self._pml_a,
+            self._pml_b_am,
+            self._pml_c,
+            self._pml_d_ae,
+            self._source_rows,
+            self._source_cols,
+            self._source_data[first_frame:last_frame],
+            self._sensor_rows,
+            self._sensor_cols,
+            self._sensor_data[first_frame:last_frame],
+            count)
+
+        if self._active_backend == SimulationBackend.CUDA:
+            _cuda_kernels.fdtd_steps(*args)
+        elif _kernels.HAS_NUMBA:
+            # the shape is taken from the captured arrays, the compiled kernel does no bounds checking
+            _kernels.get_fdtd_steps(*args[0].shape)(*args)
+        else:
+            _kernels.fdtd_steps_numpy(*args, self._scratch)
+
+        self._current_frame = last_frame
+        self._simulation_time = (time.perf_counter() - start) / count
 
-        # update sensors
-        for sensor in self._sensors.values():
-            assert sensor.data is not None
-            sensor.data[self._current_frame] = self._ez[sensor.pos_int]
+    def get_simulation_data(self) -> np.ndarray:
+        return self._ez_front
 
-        self._current_frame += 1
-        self._simulation_time = time.perf_counter() - start
+    def publish_frame(self) -> None:
+        # only called once the previous frame was processed, so the back buffer is free to fill
+        if self._active_backend == SimulationBackend.CUDA:
+            _cuda_kernels.to_host(self._ez, out=self._ez_back)
+        else:
+            np.copyto(self._ez_back, self._ez)
 
-    def get_simulation_data(self) -> np.ndarray:
-        return self._ez
+        self._ez_front, self._ez_back = self._ez_back, self._ez_front
 
     def get_pml_data(self) -> np.ndarray:
         return self._pml_profile.data
@@ -258,27 +374,76 @@ class Simulation(QtCore.QObject):
     def _regenerate_time_array(self) -> None:
         self._time_array = -np.linspace(-30 * self._dt, 30 * self._dt, self._max_time_steps)
 
+    def _select_active_backend(self) -> None:
+        backend = self._backend
+        if backend == SimulationBackend.AUTO:
+            # machines without a usable device fall back to the cpu kernels
+            use_cuda = self._dtype == np.float32 and \
+                       self._grid_size_x * self._grid_size_y >= CUDA_AUTO_MIN_GRID_CELLS and \
+                       _cuda_kernels.is_available()
+            backend = SimulationBackend.CUDA if use_cuda else SimulationBackend.CPU
+
+        self._active_backend = backend
+        self._xp = _cuda_kernels.cupy if backend == SimulationBackend.CUDA else np
+
+    def _regenerate_pml_lcp(self) -> None:
+        # layer conductivity profile doesn't depend on dt nor grid size, so it is kept between their changes
+        sigma_max = -(self._pml_order + 1) * math.log(self._pml_reflectivity) / (2 * ETA * self._pml_layers * self._dx)
+        self._pml_lcp = ((np.arange(1, self._pml_layers + 1) / self._pml_layers) ** self._pml_order) * sigma_max
+
     def _regenerate_pml_profile(self) -> None:
-        sigma = 4e-4 * np.ones(self.grid_size)
-        sigma_max = -(self._pml_order + 1) * np.log(self._pml_reflectivity) / (2 * ETA * self._pml_layers * self._dx)
-        lcp = ((np.arange(1, self._pml_layers + 1) / self._pml_layers) ** self._pml_order) * sigma_max
-        lcp_rev = np.flip(lcp)
+        sigma = np.full(self.field_shape, SIGMA_0)
+        lcp = self._pml_lcp
+        lcp_rev = lcp[::-1]
 
         sigma[1:self._pml_layers + 1, :] += lcp_rev[:, None]
         sigma[-self._pml_layers:, :] += lcp[:, None]
         sigma[:, 1:self._pml_layers + 1] += lcp_rev[None, :]
         sigma[:, -self._pml_layers:] += lcp[None, :]
 
+        half_dt = 0.5 * self._dt
+        dt_dx = self._dt / self._dx
+        half_dt_sigma_0 = half_dt * SIGMA_0
+        mu_denominator = MU_0 + half_dt_sigma_0
+
+        # electric coefficients are computed in place to limit full grid temporaries
+        c = sigma * half_dt
+        eps_denominator = c + EPS_0
+        np.subtract(EPS_0, c, out=c)
+        c /= eps_denominator
+        d = np.divide(dt_dx, eps_denominator, out=eps_denominator)
+
         self._pml_profile = PMLProfile(
-            sigma.T,
-            np.ones(sigma.shape) * ((MU_0 - 0.5 * self._dt * 4e-4) / (MU_0 + 0.5 * self._dt * 4e-4)),
-            np.ones(sigma.shape) * ((self._dt / self._dx) / (MU_0 + 0.5 * self._dt * 4e-4)),
-            (EPS_0 - 0.5 * self._dt * sigma) / (EPS_0 + 0.5 * self._dt * sigma),
-            (self._dt / self._dx) / (EPS_0 + 0.5 * self._dt * sigma))
+            sigma,
+            float((MU_0 - half_dt_sigma_0) / mu_denominator),
+            float(dt_dx / mu_denominator),
+            c.astype(self._dtype, copy=False),
+            d.astype(self._dtype, copy=False))
+
+    def _update_allowance_scalars(self) -> None:
+        # background allowance values depend only on dt and dx, objects overwrite them locally
+        self._ae_scalar = self._dtype(self._dt / (self._dx * EPS_0))
+        self._am_scalar = self._dtype(self._dt / (self._dx * MU_0))
 
     def _update_allowance_arrays(self) -> None:
-        self._ae = np.ones(self.grid_size) * (self._dt / (self._dx * EPS_0))
-        self._am = np.ones(self.grid_size) * (self._dt / (self._dx * MU_0))
+        self._ae = np.full(self.field_shape, self._ae_scalar, dtype=self._dtype)
+        self._am = np.full(self.field_shape, self._am_scalar, dtype=self._dtype)
+
+    def _update_coefficients(self) -> None:
+        # PML and material coefficients only change together with simulation parameters or objects,
+        # so their products are computed here instead of on every frame
+        self._pml_a = self._dtype(self._pml_profile.a)
+        self._pml_b_am = self._xp.asarray(self._dtype(self._pml_profile.b) * self._am)
+        self._pml_c = self._xp.asarray(self._pml_profile.c)
+        self._pml_d_ae = self._xp.asarray(self._pml_profile.d * self._ae)
+
+        # kernels walk rows along their contiguous axis, which requires row-major arrays
+        for array in (self._ez, self._hx, self._hy, self._pml_b_am, self._pml_c, self._pml_d_ae):
+            assert array.flags.c_contiguous
+
+    def _update_coefficients_region(self, region: tuple[slice, slice]) -> None:
+        self._pml_b_am[region] = self._xp.asarray(self._dtype(self._pml_profile.b) * self._am[region])
+        self._pml_d_ae[region] = self._xp.asarray(self._pml_profile.d[region] * self._ae[region])
 
     def emit_params_changed_signal(self) -> None:
         self.params_changed.emit(
@@ -291,22 +456,30 @@ class Simulation(QtCore.QObject):
                 self._pml_layers,
                 self._pml_order))
 
-    def _update_objects(self, erase_old: bool) -> None:
-        for obj in self._objects.values():
-            self._update_object(obj, erase_old)
+    def _rebuild_material_arrays(self) -> None:
+        # arrays are rebuilt from scratch, so footprints of moved or removed objects don't remain
+        self._update_allowance_arrays()
 
-    def _update_object(self, obj: SimulationObject, erase_old: bool) -> None:
-        if erase_old:
-            obj.erase(
-                self._ae,
-                self._am,
-                self._dt / (self._dx * EPS_0),
-                self._dt / (self._dx * MU_0))
+        for (object_id, obj) in self._objects.items():
+            self._object_regions[object_id] = obj.region
+            obj.place(self._ae, self._am)
 
-        obj.place(self._ae, self._am)
+        self._update_coefficients()
+
+    def _rebuild_material_region(self, region: tuple[slice, slice]) -> None:
+        # background is restored only inside of the region and all objects are placed again
+        # in their original order, clipped to the region, so overlapping objects keep their order
+        self._ae[region] = self._ae_scalar
+        self._am[region] = self._am_scalar
+
+        for obj in self._objects.values():
+            obj.place(self._ae, self._am, region)
+
+        self._update_coefficients_region(region)
 
     def _set_dt(self, dt: float, regenerate_pml: bool) -> None:
         self._dt = dt
+        self._update_allowance_scalars()
 
         if regenerate_pml:
             self._regenerate_pml_profile()
@@ -315,8 +488,52 @@ class Simulation(QtCore.QObject):
         self._recalculate_sources_data()
 
     def _recalculate_sources_data(self) -> None:
+        # sources of the same kind with the same parameters produce identical waveforms,
+        # so each unique waveform is calculated only once and shared between them
+        waveforms = dict[tuple[type, float, float, float], np.ndarray]()
         for source in self._sources.values():
-            source.calculate_data(self._time_array)
+            key = (type(source), source.frequency, source.phase_shift, source.amplitude)
+            data = waveforms.get(key, None)
+            if data is None:
+                source.calculate_data(self._time_array)
+                waveforms[key] = source.data
+            else:
+                source.data = data
+
+        self._rebuild_source_tables()
+
+    def _rebuild_source_tables(self) -> None:
+        # sources are injected by the kernel from these tables, so they have to be rebuilt
+        # whenever any source or the grid changes, sources outside of the grid are skipped
+        # as the kernel doesn't check bounds
+        sources = [
+            source for source in self._sources.values()
+            if 0 <= source.pos_x_int < self._grid_size_x and 0 <= source.pos_y_int < self._grid_size_y]
+        self._source_rows = np.array([source.pos_y_int for source in sources], dtype=np.int32)
+        self._source_cols = np.array([source.pos_x_int for source in sources], dtype=np.int32)
+        # stored time-major, so the values for a batch of frames form one contiguous block
+        self._source_data = np.empty((self._max_time_steps, len(sources)), dtype=self._dtype)
+        for (i, source) in enumerate(sources):
+            self._source_data[:, i] = source.data
+
+    def _rebuild_sensor_tables(self) -> None:
+        # kernels record sensors straight into the time-major data table, data of every recorded
+        # sensor is a view of its column, sensors outside of the grid are not recorded
+        sensors = [
+            sensor for sensor in self._sensors.values()
+            if 0 <= sensor.pos_x_int < self._grid_size_x and 0 <= sensor.pos_y_int < self._grid_size_y]
+        self._sensor_rows = np.array([sensor.pos_y_int for sensor in sensors], dtype=np.int32)
+        self._sensor_cols = np.array([sensor.pos_x_int for sensor in sensors], dtype=np.int32)
+        self._sensor_data = np.empty((self._max_time_steps, len(sensors)), dtype=self._dtype)
+        for (i, sensor) in enumerate(sensors):
+            assert sensor.data is not None
+            self._sensor_data[:, i] = sensor.data
+            sensor.data = self._sensor_data[:, i]
 
 def _calculate_auto_dt(dx: float) -> float:
     return S * dx / C
+
+def _bounding_region(a: tuple[slice, slice], b: tuple[slice, slice]) -> tuple[slice, slice]:
+    return (
+        slice(min(a[0].start, b[0].start), max(a[0].stop, b[0].stop)),
+        slice(min(a[1].start, b[1].start), max(a[1].stop, b[1].stop)))
@@ -0,0 +1,8 @@
+import enum
+
+
+class SimulationBackend(enum.Enum):
+    CPU = enum.auto()
+    CUDA = enum.auto()
+    # CUDA for grids large enough to benefit from it, when cupy is available
+    AUTO = enum.auto()
@@ -5,7 +5,11 @@ import numpy as np
 from main.simulation.sources.simulation_source import SimulationSource
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CosineSource(SimulationSource):
     def calculate_data(self, time_array: np.ndarray) -> None:
-        self.data = np.sin(2 * np.pi * self.frequency * time_array + self.phase_shift) * self.amplitude
+        data = np.multiply(time_array, 2 * np.pi * self.frequency)
+        data += self.phase_shift
+        np.cos(data, out=data)
+        data *= self.amplitude
+        self.data = data
@@ -1,34 +1,33 @@
 import abc
 import dataclasses
+import typing as t
 
 import numpy as np
 
+from main.simulation._int_cache import IntFieldCache
+
+
+@dataclasses.dataclass(slots=True)
+class SimulationSource(IntFieldCache, abc.ABC):
+    _int_fields: t.ClassVar[tuple[str, ...]] = ('pos_x', 'pos_y')
 
-@dataclasses.dataclass
-class SimulationSource(abc.ABC):
     pos_x: float
     pos_y: float
     frequency: float
     phase_shift: float
     amplitude: float
     data: np.ndarray = dataclasses.field(init=False)
+    pos_x_int: int = dataclasses.field(init=False, repr=False, compare=False)
+    pos_y_int: int = dataclasses.field(init=False, repr=False, compare=False)
 
     @abc.abstractmethod
     def calculate_data(self, time_array: np.ndarray) -> None:
         pass
 
-    @property
-    def pos_x_int(self) -> int:
-        return int(self.pos_x)
-
-    @property
-    def pos_y_int(self) -> int:
-        return int(self.pos_y)
-
     @property
     def pos(self) -> tuple[float, float]:
         return (self.pos_x, self.pos_y)
 
     @property
     def pos_int(self) -> tuple[int, int]:
-        return (int(self.pos_x), int(self.pos_y))
+        return (self.pos_x_int, self.pos_y_int)
@@ -5,7 +5,12 @@ import numpy as np
 from main.simulation.sources.simulation_source import SimulationSource
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SineSource(SimulationSource):
     def calculate_data(self, time_array: np.ndarray) -> None:
-        self.data = np.sin(2 * np.pi * self.frequency * time_array + self.phase_shift) * self.amplitude
+        # computed in place, so no temporary arrays of max_time_steps length are created
+        data = np.multiply(time_array, 2 * np.pi * self.frequency)
+        data += self.phase_shift
+        np.sin(data, out=data)
+        data *= self.amplitude
+        self.data = data
@@ -1,34 +1,49 @@
-import threading
-
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QSemaphore, pyqtSignal
 
 from main.simulation.simulation import Simulation
 
-JOB_THREAD_WAIT_TIMEOUT = 0.016 # 16 milliseconds
+MAX_PENDING_FRAMES = 1
+FRAME_SLOT_WAIT_MS = 50
 
-class SimulationJob(QThread):
+class SimulationJob(QObject):
     frame_ready = pyqtSignal()
 
-    def __init__(self, simulation: Simulation) -> None:
+    def __init__(self, simulation: Simulation, steps_per_render: int) -> None:
         super().__init__()
 
         self._simulation = simulation
+        self._steps_per_render = steps_per_render
         self._is_running = True
-        self._previous_frame_processed_event = threading.Event()
-        self._previous_frame_processed_event.set()
+        # each emitted frame holds a slot until the receiver processes it, which avoids flooding
+        # the receiver's event queue and makes every simulated batch rendered
+        self._frame_slots = QSemaphore(MAX_PENDING_FRAMES)
 
     def notify_frame_processed(self) -> None:
-        self._previous_frame_processed_event.set()
+        # frames queued by a previous job may still be delivered, these must not add extra slots
+        if self._frame_slots.available() < MAX_PENDING_FRAMES:
+            self._frame_slots.release()
 
     def stop(self) -> None:
         self._is_running = False
 
     def run(self) -> None:
         while self._is_running:
-            if not self._previous_frame_processed_event.wait(JOB_THREAD_WAIT_TIMEOUT):
-                continue
+            if self._simulation.current_frame >= self._simulation.max_time_steps:
+                break
+
+            # frames between renders are simulated in a single batch
+            self._simulation.simulate_frames(self._steps_per_render)
+
+            if not self._acquire_frame_slot():
+                break
 
-            self._simulation.simulate_frame()
+            self._simulation.publish_frame()
             self.frame_ready.emit()
 
-            self._previous_frame_processed_event.clear()
+    def _acquire_frame_slot(self) -> bool:
+        # waits are bounded so a stop request is noticed while the receiver is busy
+        while self._is_running:
+            if self._frame_slots.tryAcquire(1, FRAME_SLOT_WAIT_MS):
+                return True
+
+        return False
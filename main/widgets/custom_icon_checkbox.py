@@ -1,27 +1,24 @@
-from PyQt6.QtWidgets import QCheckBox, QWidget
+import typing as t
+
+from PyQt6.QtWidgets import QCheckBox
 
-DEFAULT_CHECKBOX_SIZE = 16
-VISIBLE_ICON_PATH = './ui/icons/visible_icon.svg'
-NOT_VISIBLE_ICON_PATH = './ui/icons/not_visible_icon.svg'
-STYLESHEET = f'QCheckBox::indicator:checked {{image: url({VISIBLE_ICON_PATH});}} QCheckBox::indicator:unchecked {{image: url({NOT_VISIBLE_ICON_PATH});}} QCheckBox::indicator {{width: {DEFAULT_CHECKBOX_SIZE}px;height: {DEFAULT_CHECKBOX_SIZE}px;}}'
 
 class CustomIconCheckbox(QCheckBox):
-    def __init__(self,
-                 checked_icon_path: str,
-                 unchecked_icon_path: str,
-                 checkbox_size: int,
-                 parent: QWidget | None = None) -> None:
-        super().__init__(parent)
+    # icons are applied through the application stylesheet, which is parsed once for all instances
+    checked_icon_path: t.ClassVar[str]
+    unchecked_icon_path: t.ClassVar[str]
+    checkbox_size: t.ClassVar[int]
 
-        self.setStyleSheet(
-            f'''
-            QCheckBox::indicator:checked{{
-                image: url({checked_icon_path});
+    @classmethod
+    def get_stylesheet(cls) -> str:
+        return f'''
+            {cls.__name__}::indicator:checked{{
+                image: url({cls.checked_icon_path});
             }}
-            QCheckBox::indicator:unchecked{{
-                image: url({unchecked_icon_path});
+            {cls.__name__}::indicator:unchecked{{
+                image: url({cls.unchecked_icon_path});
             }}
-            QCheckBox::indicator{{
-                width: {checkbox_size}px;
-                height: {checkbox_size}px;
-            }}''')
+            {cls.__name__}::indicator{{
+                width: {cls.checkbox_size}px;
+                height: {cls.checkbox_size}px;
+            }}'''
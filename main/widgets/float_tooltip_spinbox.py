@@ -1,24 +1,33 @@
 import typing as t
 
 from PyQt6.QtCore import pyqtSlot
-from PyQt6.QtWidgets import QDoubleSpinBox, QWidget
+from PyQt6.QtWidgets import QWidget
 
+from main.widgets.throttled_spinbox import ThrottledSpinbox
 
-class FloatTooltipSpinbox(QDoubleSpinBox):
+
+class FloatTooltipSpinbox(ThrottledSpinbox):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
 
-        self.valueChanged.connect(self._value_changed_cb)
         self.validate_func: t.Callable[[float], bool] | None = None
 
         self._last_value = 0.0
 
+    def setValue(self, value: float) -> None:
+        super().setValue(value)
+
+        # programmatic updates may happen with signals blocked, so the tooltip is synchronized here as well
+        self._last_value = self.value()
+        self.setToolTip(f'{self._last_value:.2E}')
+
     @pyqtSlot(float)
-    def _value_changed_cb(self, new_value: float) -> None:
+    def _throttle_value_changed_cb(self, new_value: float) -> None:
+        # rejected values are reverted before they can reach the throttled signal
         if self.validate_func is not None and not self.validate_func(new_value):
             self.setValue(self._last_value)
             return
 
         self._last_value = new_value
         self.setToolTip(f'{new_value:.2E}')
-
+        super()._throttle_value_changed_cb(new_value)
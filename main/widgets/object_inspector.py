@@ -5,14 +5,16 @@ from main.simulation.objects.simulation_object import SimulationObject
 from main.widgets.float_tooltip_spinbox import FloatTooltipSpinbox
 
 OBJECT_INSPECTOR_UI_FILEPATH = './ui/object_inspector.ui'
+(_ObjectInspectorForm, _) = uic.loadUiType(OBJECT_INSPECTOR_UI_FILEPATH)
 
-class ObjectInspector(QtWidgets.QWidget):
+class ObjectInspector(QtWidgets.QWidget, _ObjectInspectorForm):
     object_params_changed = QtCore.pyqtSignal()
 
     def __init__(self) -> None:
         super().__init__()
 
-        self._object: SimulationObject | None = None
+        # the only object type is a box, keeping it typed spares the callbacks any type checks
+        self._box: Box | None = None
 
         self.width_input: QtWidgets.QDoubleSpinBox
         self.height_input: QtWidgets.QDoubleSpinBox
@@ -22,7 +24,11 @@ class ObjectInspector(QtWidgets.QWidget):
         self.x_input: QtWidgets.QDoubleSpinBox
         self.y_input: QtWidgets.QDoubleSpinBox
 
-        uic.load_ui.loadUi(OBJECT_INSPECTOR_UI_FILEPATH, self)
+        self.setupUi(self)
+
+        # values are committed once editing is finished instead of on every keystroke
+        for spinbox in (self.width_input, self.height_input, self.x_input, self.y_input, self.permittivity_input, self.permeability_input):
+            spinbox.setKeyboardTracking(False)
 
         self.width_input.valueChanged.connect(self._width_changed_cb)
         self.height_input.valueChanged.connect(self._height_changed_cb)
@@ -31,48 +37,40 @@ class ObjectInspector(QtWidgets.QWidget):
         self.permittivity_input.valueChanged.connect(self._permittivity_input_changed_cb)
         self.permeability_input.valueChanged.connect(self._permeability_input_changed_cb)
 
-    @QtCore.pyqtSlot()
-    def _permittivity_input_changed_cb(self) -> None:
-        assert isinstance(self._object, Box)
-
-        self._object.permittivity = self.permittivity_input.value()
-        self.object_params_changed.emit()
-
-    @QtCore.pyqtSlot()
-    def _permeability_input_changed_cb(self) -> None:
-        assert isinstance(self._object, Box)
-
-        self._object.permeability = self.permeability_input.value()
-        self.object_params_changed.emit()
-
-    @QtCore.pyqtSlot()
-    def _x_input_changed_cb(self) -> None:
-        assert isinstance(self._object, Box)
-
-        self._object.pos_x = self.x_input.value()
-        self.object_params_changed.emit()
-
-    @QtCore.pyqtSlot()
-    def _y_input_changed_cb(self) -> None:
-        assert isinstance(self._object, Box)
+    @QtCore.pyqtSlot(float)
+    def _permittivity_input_changed_cb(self, new_value: float) -> None:
+        if self._box is not None:
+            self._box.permittivity = new_value
+            self.object_params_changed.emit()
 
-        self._object.pos_y = self.y_input.value()
-        self.object_params_changed.emit()
+    @QtCore.pyqtSlot(float)
+    def _permeability_input_changed_cb(self, new_value: float) -> None:
+        if self._box is not None:
+            self._box.permeability = new_value
+            self.object_params_changed.emit()
 
-    @QtCore.pyqtSlot()
-    def _width_changed_cb(self) -> None:
-        if self._object is not None:
-            assert isinstance(self._object, Box)
+    @QtCore.pyqtSlot(float)
+    def _x_input_changed_cb(self, new_value: float) -> None:
+        if self._box is not None:
+            self._box.pos_x = new_value
+            self.object_params_changed.emit()
 
-            self._object.width = self.width_input.value()
+    @QtCore.pyqtSlot(float)
+    def _y_input_changed_cb(self, new_value: float) -> None:
+        if self._box is not None:
+            self._box.pos_y = new_value
             self.object_params_changed.emit()
 
-    @QtCore.pyqtSlot()
-    def _height_changed_cb(self) -> None:
-        if self._object is not None:
-            assert isinstance(self._object, Box)
+    @QtCore.pyqtSlot(float)
+    def _width_changed_cb(self, new_value: float) -> None:
+        if self._box is not None:
+            self._box.width = new_value
+            self.object_params_changed.emit()
 
-            self._object.height = self.height_input.value()
+    @QtCore.pyqtSlot(float)
+    def _height_changed_cb(self, new_value: float) -> None:
+        if self._box is not None:
+            self._box.height = new_value
             self.object_params_changed.emit()
 
     def set_simulation_size(self, x: float, y: float) -> None:
@@ -80,30 +78,47 @@ class ObjectInspector(QtWidgets.QWidget):
         current_height = 0.0
         current_x = 0.0
         current_y = 0.0
-        if self._object is not None:
-            assert isinstance(self._object, Box)
-
-            current_width = self._object.width
-            current_height = self._object.height
-            current_x = self._object.pos_x
-            current_y = self._object.pos_y
-
-        self.x_input.setMaximum(x - current_width)
-        self.y_input.setMaximum(y - current_height)
-        self.width_input.setMaximum(x - current_x)
-        self.height_input.setMaximum(y - current_y)
+        if self._box is not None:
+            current_width = self._box.width
+            current_height = self._box.height
+            current_x = self._box.pos_x
+            current_y = self._box.pos_y
+
+        # values clamped by the new maximums are written back to the object at once
+        inputs = (self.x_input, self.y_input, self.width_input, self.height_input)
+        old_values = tuple(spinbox.value() for spinbox in inputs)
+        with (QtCore.QSignalBlocker(self.x_input),
+              QtCore.QSignalBlocker(self.y_input),
+              QtCore.QSignalBlocker(self.width_input),
+              QtCore.QSignalBlocker(self.height_input)):
+            self.x_input.setMaximum(x - current_width)
+            self.y_input.setMaximum(y - current_height)
+            self.width_input.setMaximum(x - current_x)
+            self.height_input.setMaximum(y - current_y)
+
+        new_values = tuple(spinbox.value() for spinbox in inputs)
+        if self._box is not None and new_values != old_values:
+            (self._box.pos_x, self._box.pos_y, self._box.width, self._box.height) = new_values
+            self.object_params_changed.emit()
 
     def set_object(self, object: SimulationObject | None) -> None:
-        self._object = object
+        self._box = object if isinstance(object, Box) else None
 
-        if object is None:
+        if self._box is None:
             return
 
-        assert isinstance(object, Box)
         self.object_name_label.setText('Object')
-        self.width_input.setValue(object.width)
-        self.height_input.setValue(object.height)
-        self.permeability_input.setValue(object.permeability)
-        self.permittivity_input.setValue(object.permittivity)
-        self.x_input.setValue(object.pos_x)
-        self.y_input.setValue(object.pos_y)
+
+        # inputs are only synchronized with the object, writing them back would rebind the simulation
+        with (QtCore.QSignalBlocker(self.width_input),
+              QtCore.QSignalBlocker(self.height_input),
+              QtCore.QSignalBlocker(self.permeability_input),
+              QtCore.QSignalBlocker(self.permittivity_input),
+              QtCore.QSignalBlocker(self.x_input),
+              QtCore.QSignalBlocker(self.y_input)):
+            self.width_input.setValue(self._box.width)
+            self.height_input.setValue(self._box.height)
+            self.permeability_input.setValue(self._box.permeability)
+            self.permittivity_input.setValue(self._box.permittivity)
+            self.x_input.setValue(self._box.pos_x)
+            self.y_input.setValue(self._box.pos_y)
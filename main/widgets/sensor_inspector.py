@@ -1,17 +1,18 @@
 from PyQt6 import uic
-from PyQt6.QtCore import pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QSignalBlocker, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QDoubleSpinBox, QLabel, QWidget
 
 from main.simulation.sensor import SimulationSensor
 
 _SENSOR_INSPECTOR_UI_FILEPATH = './ui/sensor_inspector.ui'
+(_SensorInspectorForm, _) = uic.loadUiType(_SENSOR_INSPECTOR_UI_FILEPATH)
 
-class SensorInspector(QWidget):
+class SensorInspector(QWidget, _SensorInspectorForm):
     sensor_params_changed = pyqtSignal()
 
     def __init__(self) -> None:
         super().__init__()
-        uic.load_ui.loadUi(_SENSOR_INSPECTOR_UI_FILEPATH, self)
+        self.setupUi(self)
 
         self._sensor: SimulationSensor | None = None
 
@@ -21,6 +22,10 @@ class SensorInspector(QWidget):
         self.sensor_y_input: QDoubleSpinBox
         self.sensor_y_input.valueChanged.connect(self._sensor_y_input_changed_cb)
 
+        # values are committed once editing is finished instead of on every keystroke
+        self.sensor_x_input.setKeyboardTracking(False)
+        self.sensor_y_input.setKeyboardTracking(False)
+
         self.sensor_name_label: QLabel
 
     def set_sensor_max_pos(self, x: float | None, y: float | None) -> None:
@@ -34,8 +39,10 @@ class SensorInspector(QWidget):
             return
 
         self.sensor_name_label.setText(type(sensor).__name__)
-        self.sensor_x_input.setValue(sensor.pos_x)
-        self.sensor_y_input.setValue(sensor.pos_y)
+
+        with QSignalBlocker(self.sensor_x_input), QSignalBlocker(self.sensor_y_input):
+            self.sensor_x_input.setValue(sensor.pos_x)
+            self.sensor_y_input.setValue(sensor.pos_y)
 
     @pyqtSlot(float)
     def _sensor_x_input_changed_cb(self, new_value: float) -> None:
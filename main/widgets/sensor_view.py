@@ -1,6 +1,9 @@
 import time
+import typing as t
 
+import matplotlib
 import numpy as np
+from matplotlib.axes import Axes
 from matplotlib.lines import Line2D
 from PyQt6 import uic
 from PyQt6.QtCore import pyqtSlot
@@ -10,8 +13,19 @@ from main.widgets.expand_checkbox import ExpandCheckbox
 from main.widgets.mpl_canvas import MPLCanvas
 
 _UI_FILEPATH = './ui/sensor_view.ui'
+POINTS_PER_PIXEL = 2
+Y_RANGE_MARGIN = 0.1
+MIN_Y_RANGE_FILL = 0.5
 
-class SensorView(QWidget):
+# ui file is parsed once on import, each view only runs the generated setup code
+(_SensorViewForm, _) = uic.loadUiType(_UI_FILEPATH)
+
+# time axis carries no ticks, setting it up through rc params avoids building and then discarding them
+_AXES_RC_PARAMS = {
+    'xtick.bottom': False,
+    'xtick.labelbottom': False}
+
+class SensorView(QWidget, _SensorViewForm):
     def __init__(self, name: str, parent: QWidget | None = None) -> None:
         super().__init__(parent)
 
@@ -19,19 +33,30 @@ class SensorView(QWidget):
         self.expand_checkbox: ExpandCheckbox
         self.name_label: QLabel
 
-        uic.load_ui.loadUi(_UI_FILEPATH, self)
+        self.setupUi(self)
 
         self.expand_checkbox.checkStateChanged.connect(self._expand_state_changed_cb)
         self.name_label.setText(name)
 
-        self.render_area.figure.tight_layout()
-
-        self._axes = self.render_area.figure.add_subplot(1, 1, 1)
-        self._axes.invert_xaxis()
-        self._axes.set_xticks([])
-
+        # axes are created with the first plotted data, so views that are never expanded skip it
+        self._axes: Axes | None = None
         self._plot_line: Line2D | None = None
+        self._time_data: np.ndarray | None = None
+        self._max_points = 0
+        self._plot_time = np.empty((0, ))
+        self._plot_values = np.empty((0, ))
+        self._bin_starts: np.ndarray | None = None
+        self._limits: tuple[tuple[float, float], tuple[float, float]] | None = None
+        self._background: t.Any = None
         self._draw_time = 0.0
+        self._is_expanded = self.expand_checkbox.isChecked()
+
+        # any full redraw, including ones caused by resizing, invalidates the cached background
+        self.render_area.mpl_connect('draw_event', self._canvas_drawn_cb)
+
+    @property
+    def is_expanded(self) -> bool:
+        return self._is_expanded
 
     @property
     def draw_time(self) -> float:
@@ -42,20 +67,58 @@ class SensorView(QWidget):
         return self._draw_time * 1000.0
 
     def update_sensor_data(self, sensor_data: np.ndarray, time_data: np.ndarray) -> None:
-        start = time.perf_counter()
-
-        if self.expand_checkbox.isChecked():
-            if self._plot_line is None:
-                lines = self._axes.plot(time_data, sensor_data)
-                assert len(lines) > 0
+        if not self._is_expanded:
+            self._draw_time = 0.0
+            return
 
-                self._plot_line = lines[0]
-            else:
-                self._plot_line.set_data(time_data, sensor_data)
+        start = time.perf_counter()
 
-            self._axes.relim()
-            self._axes.autoscale_view(True, False, True)
+        axes = self._get_axes()
+
+        # time axis only depends on the time array and the axes width, so it is rebuilt
+        # together with the decimation bins only when one of them changes
+        max_points = int(axes.bbox.width) * POINTS_PER_PIXEL
+        time_changed = time_data is not self._time_data or max_points != self._max_points
+        if time_changed:
+            self._time_data = time_data
+            self._max_points = max_points
+            self._update_plot_time(time_data, max_points, sensor_data.dtype)
+
+        if self._bin_starts is not None:
+            # there is no point in handing matplotlib more points than the axes have pixels
+            np.minimum.reduceat(sensor_data, self._bin_starts, out=self._plot_values[0::2])
+            np.maximum.reduceat(sensor_data, self._bin_starts, out=self._plot_values[1::2])
+            sensor_data = self._plot_values
+
+        if self._plot_line is None:
+            # line is animated so it is left out of the cached background
+            lines = axes.plot(self._plot_time, sensor_data, animated=True, antialiased=False)
+            assert len(lines) > 0
+
+            self._plot_line = lines[0]
+        elif time_changed:
+            self._plot_line.set_data(self._plot_time, sensor_data)
+        else:
+            self._plot_line.set_ydata(sensor_data)
+
+        # y-limits are set directly from the data extent, with some slack so a stable signal
+        # does not rescale the axes, and the redraw that follows, on every frame
+        if sensor_data.size > 0:
+            (low, high) = (float(sensor_data.min()), float(sensor_data.max()))
+            (y_min, y_max) = axes.get_ylim()
+            if low < y_min or high > y_max or (high - low) < (y_max - y_min) * MIN_Y_RANGE_FILL:
+                margin = (high - low) * Y_RANGE_MARGIN if high > low else 1.0
+                axes.set_ylim(low - margin, high + margin)
+
+        limits = (axes.get_xlim(), axes.get_ylim())
+        if limits != self._limits or self._background is None:
+            self._limits = limits
             self.render_area.draw()
+        else:
+            self.render_area.restore_region(self._background)
+
+        axes.draw_artist(self._plot_line)
+        self.render_area.blit(axes.bbox)
 
         self._draw_time = time.perf_counter() - start
 
@@ -63,14 +126,57 @@ class SensorView(QWidget):
     def _expand_state_changed_cb(self) -> None:
         parent_layout = self._get_parent_layout()
 
-        if self.expand_checkbox.isChecked():
-            self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            QWidget.show(self.render_area)
-        else:
-            self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Maximum)
-            QWidget.hide(self.render_area)
-
-        parent_layout.update()
+        # size policy and visibility changes are repainted together once updates are enabled again
+        parent = self.parentWidget()
+        if parent is not None:
+            parent.setUpdatesEnabled(False)
+        try:
+            self._is_expanded = self.expand_checkbox.isChecked()
+            if self._is_expanded:
+                self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+                QWidget.show(self.render_area)
+            else:
+                self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Maximum)
+                QWidget.hide(self.render_area)
+
+            parent_layout.update()
+        finally:
+            if parent is not None:
+                parent.setUpdatesEnabled(True)
+
+    def _update_plot_time(self, time_data: np.ndarray, max_points: int, dtype: np.dtype) -> None:
+        if max_points <= 0 or time_data.size <= max_points:
+            self._bin_starts = None
+            self._plot_time = time_data
+            return
+
+        # each bin is reduced to its minimum and maximum so the signal envelope is preserved
+        bin_size = -(-time_data.size // (max_points // 2))
+        self._bin_starts = np.arange(0, time_data.size, bin_size)
+        bin_ends = np.minimum(self._bin_starts + bin_size - 1, time_data.size - 1)
+
+        self._plot_time = np.empty(2 * self._bin_starts.size, dtype=time_data.dtype)
+        self._plot_time[0::2] = time_data[self._bin_starts]
+        self._plot_time[1::2] = time_data[bin_ends]
+        self._plot_values = np.empty(self._plot_time.shape, dtype=dtype)
+
+    def _canvas_drawn_cb(self, _: t.Any) -> None:
+        if self._axes is not None:
+            self._background = self.render_area.copy_from_bbox(self._axes.bbox)
+
+            # the animated line is not part of a full draw, so it is put back on top of it
+            if self._plot_line is not None:
+                self._axes.draw_artist(self._plot_line)
+                self.render_area.blit(self._axes.bbox)
+
+    def _get_axes(self) -> Axes:
+        if self._axes is None:
+            with matplotlib.rc_context(_AXES_RC_PARAMS):
+                self._axes = self.render_area.figure.add_subplot(1, 1, 1)
+
+            self._axes.invert_xaxis()
+
+        return self._axes
 
     def _get_parent_layout(self) -> QGridLayout:
         parent_layout = self.layout()
@@ -1,8 +1,11 @@
 import time
+import typing as t
+import uuid
 
+import numpy as np
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.image import AxesImage
-from matplotlib.patches import Circle, Rectangle
+from matplotlib.patches import Circle, Patch, Rectangle
 from PyQt6.QtWidgets import QWidget
 
 from main.simulation.simulation import Simulation
@@ -24,6 +27,12 @@ class SimulationRenderArea(FigureCanvasQTAgg):
 
         self._axes = self.figure.add_subplot(1, 1, 1)
         self._axes_image: AxesImage | None = None
+        # overlay patches persist between redraws and are only created or removed when items come and go
+        self._source_patches = dict[uuid.UUID, Circle]()
+        self._sensor_patches = dict[uuid.UUID, Rectangle]()
+        self._object_patches = dict[uuid.UUID, Patch]()
+        self._background: t.Any = None
+        self._background_bounds: tuple[tuple[int, int], tuple[float, float, float, float]] | None = None
         self._draw_time = 0.0
 
     def draw(self, do_full_redraw: bool = False) -> None:
@@ -40,42 +49,88 @@ class SimulationRenderArea(FigureCanvasQTAgg):
             else:
                 sim_data = self.simulation.get_simulation_data()
 
-            if self._axes_image is None or do_full_redraw:
-                self._axes.clear()
+            if do_full_redraw or not self._can_blit(sim_data):
+                if self._axes_image is not None:
+                    self._axes_image.remove()
+
+                # animated artists are excluded from the cached background and drawn on top of it
                 self._axes_image = self._axes.imshow(
                     sim_data,
                     origin='lower',
                     vmin=vmin,
                     vmax=vmax,
-                    cmap=cmap)
+                    cmap=cmap,
+                    animated=True)
+                self._update_overlays()
+
+                super().draw()
+
+                self._background = self.copy_from_bbox(self._axes.bbox)
+                self._background_bounds = self._get_bounds()
             else:
+                assert self._axes_image is not None
                 self._axes_image.set_data(sim_data)
+                self._update_overlays()
+                self.restore_region(self._background)
 
-            if self.show_sources:
-                for source in self.simulation.sources.values():
-                    self._axes.add_patch(
-                        Circle(
-                            source.pos,
-                            self.source_radius,
-                            color=self.source_color))
-
-            if self.show_sensors:
-                for sensor in self.simulation.sensors.values():
-                    self._axes.add_patch(
-                        Rectangle(
-                            sensor.pos,
-                            4,
-                            4,
-                            color=self.sensor_color))
-
-            if self.show_objects:
-                for obj in self.simulation.objects.values():
-                    obj.draw(self._axes)
-
-        super().draw()
+            self._draw_animated_artists()
+            self.blit(self._axes.bbox)
+        else:
+            super().draw()
 
         self._draw_time = time.perf_counter() - start
 
+    def _can_blit(self, sim_data: np.ndarray) -> bool:
+        return self._axes_image is not None and \
+               self._background is not None and \
+               self._background_bounds == self._get_bounds() and \
+               self._axes_image.get_array().shape == sim_data.shape # type: ignore
+
+    def _get_bounds(self) -> tuple[tuple[int, int], tuple[float, float, float, float]]:
+        # background becomes invalid when either canvas or axes geometry changes
+        return (self.get_width_height(), self._axes.bbox.bounds)
+
+    def _update_overlays(self) -> None:
+        assert self.simulation is not None
+
+        sources = self.simulation.sources if self.show_sources else {}
+        _remove_stale_patches(self._source_patches, sources)
+        for (source_id, source) in sources.items():
+            source_patch = self._source_patches.get(source_id)
+            if source_patch is None:
+                source_patch = Circle(source.pos, self.source_radius, color=self.source_color, animated=True)
+                self._source_patches[source_id] = self._axes.add_patch(source_patch)
+            else:
+                source_patch.set_center(source.pos)
+
+        sensors = self.simulation.sensors if self.show_sensors else {}
+        _remove_stale_patches(self._sensor_patches, sensors)
+        for (sensor_id, sensor) in sensors.items():
+            sensor_patch = self._sensor_patches.get(sensor_id)
+            if sensor_patch is None:
+                sensor_patch = Rectangle(sensor.pos, 4, 4, color=self.sensor_color, animated=True)
+                self._sensor_patches[sensor_id] = self._axes.add_patch(sensor_patch)
+            else:
+                sensor_patch.set_xy(sensor.pos)
+
+        objects = self.simulation.objects if self.show_objects else {}
+        _remove_stale_patches(self._object_patches, objects)
+        for (object_id, obj) in objects.items():
+            object_patch = self._object_patches.get(object_id)
+            if object_patch is None:
+                object_patch = obj.draw(self._axes)
+                object_patch.set_animated(True)
+                self._object_patches[object_id] = object_patch
+            else:
+                obj.update_patch(object_patch)
+
+    def _draw_animated_artists(self) -> None:
+        assert self._axes_image is not None
+
+        self._axes.draw_artist(self._axes_image)
+        for patch in self._axes.patches:
+            self._axes.draw_artist(patch)
+
     @property
     def draw_time(self) -> float:
         return self._draw_time
@@ -87,3 +142,7 @@ class SimulationRenderArea(FigureCanvasQTAgg):
     @property
     def draw_simulation(self) -> bool:
         return not self.draw_pml
+
+def _remove_stale_patches(patches: dict[uuid.UUID, t.Any], items: t.Mapping[uuid.UUID, t.Any]) -> None:
+    for item_id in [item_id for item_id in patches if item_id not in items]:
+        patches.pop(item_id).remove()
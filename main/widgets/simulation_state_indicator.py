@@ -1,20 +1,30 @@
+import functools
+
+from PyQt6.QtCore import QByteArray
 from PyQt6.QtSvgWidgets import QSvgWidget
 from PyQt6.QtWidgets import QBoxLayout, QFrame, QWidget
 
 from main.simulation.simulation_state import SimulationState
 
+_ICON_FILEPATHS = {
+    SimulationState.OK: './ui/icons/simulation_ok_icon.svg',
+    SimulationState.ERROR: './ui/icons/simulation_error_icon.svg',
+    SimulationState.RUNNING: './ui/icons/simulation_running_icon.svg'}
+_TOOLTIP_TEXTS = {
+    SimulationState.OK: 'Simulation ready',
+    SimulationState.RUNNING: 'Simulation running',
+    SimulationState.ERROR: 'Simulation error occurred'}
 
 class SimulationStateIndicator(QFrame):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
 
-        self._simulation_state_icons = {
-            SimulationState.OK: QSvgWidget('./ui/icons/simulation_ok_icon.svg'),
-            SimulationState.ERROR: QSvgWidget('./ui/icons/simulation_error_icon.svg'),
-            SimulationState.RUNNING: QSvgWidget('./ui/icons/simulation_running_icon.svg')}
-        self._current_icon = self._simulation_state_icons[SimulationState.OK]
+        # a single svg widget is reused for every state, only its contents are swapped
+        self._icon = QSvgWidget()
+        self._icon.load(_get_icon_data(SimulationState.OK))
+        self._state = SimulationState.OK
         self._layout = QBoxLayout(QBoxLayout.Direction.LeftToRight)
-        self._layout.addWidget(self._current_icon)
+        self._layout.addWidget(self._icon)
 
         self.setFixedSize(16, 16)
         self.setContentsMargins(0, 0, 0, 0)
@@ -23,23 +33,18 @@ class SimulationStateIndicator(QFrame):
         self.show()
 
     def set_state(self, state: SimulationState) -> None:
-        self.setToolTip(_get_tooltip_text(state))
+        if state == self._state:
+            return
 
-        new_icon = self._simulation_state_icons[state]
-        new_icon.show()
-
-        self._layout.replaceWidget(self._current_icon, new_icon)
+        self._state = state
+        self.setToolTip(_get_tooltip_text(state))
+        self._icon.load(_get_icon_data(state))
 
-        self._current_icon.hide()
-        self._current_icon = new_icon
+@functools.cache
+def _get_icon_data(state: SimulationState) -> QByteArray:
+    # icon files are read once and shared by all indicators
+    with open(_ICON_FILEPATHS[state], 'rb') as icon_file:
+        return QByteArray(icon_file.read())
 
 def _get_tooltip_text(state: SimulationState) -> str:
-    match state:
-        case SimulationState.OK:
-            return 'Simulation ready'
-        case SimulationState.RUNNING:
-            return 'Simulation running'
-        case SimulationState.ERROR:
-            return 'Simulation error occurred'
-
-    return ''
+    return _TOOLTIP_TEXTS.get(state, '')
@@ -3,48 +3,70 @@ from PyQt6 import QtCore, QtWidgets, uic
 
 from main.simulation.sources.simulation_source import SimulationSource
 from main.widgets.float_tooltip_spinbox import FloatTooltipSpinbox
+from main.widgets.throttled_spinbox import ThrottledSpinbox
 
 _SOURCE_INSPECTOR_UI_FILEPATH = './ui/source_inspector.ui'
+(_SourceInspectorForm, _) = uic.loadUiType(_SOURCE_INSPECTOR_UI_FILEPATH)
 
-class SourceInspector(QtWidgets.QWidget):
+class SourceInspector(QtWidgets.QWidget, _SourceInspectorForm):
     source_params_changed = QtCore.pyqtSignal()
 
     def __init__(self) -> None:
         super().__init__()
-        uic.load_ui.loadUi(_SOURCE_INSPECTOR_UI_FILEPATH, self)
+        self.setupUi(self)
 
         self._source: SimulationSource | None = None
 
         self.source_name_label: QtWidgets.QLabel
 
         self.source_frequency_input: FloatTooltipSpinbox
-        self.source_frequency_input.valueChanged.connect(self._source_frequency_input_changed_cb)
+        self.source_frequency_input.value_changed_throttled.connect(self._source_frequency_input_changed_cb)
         self.source_frequency_input.setMaximum(np.inf)
 
-        self.source_x_input: QtWidgets.QDoubleSpinBox
-        self.source_x_input.valueChanged.connect(self._source_x_input_changed_cb)
+        self.source_x_input: ThrottledSpinbox
+        self.source_x_input.value_changed_throttled.connect(self._source_x_input_changed_cb)
 
-        self.source_y_input: QtWidgets.QDoubleSpinBox
-        self.source_y_input.valueChanged.connect(self._source_y_input_changed_cb)
+        self.source_y_input: ThrottledSpinbox
+        self.source_y_input.value_changed_throttled.connect(self._source_y_input_changed_cb)
 
         self.phase_shift_input: FloatTooltipSpinbox
-        self.phase_shift_input.valueChanged.connect(self._source_phase_shift_changed_cb)
+        self.phase_shift_input.value_changed_throttled.connect(self._source_phase_shift_changed_cb)
 
         self.amplitude_input: FloatTooltipSpinbox
-        self.amplitude_input.valueChanged.connect(self._source_amplitude_changed_cb)
+        self.amplitude_input.value_changed_throttled.connect(self._source_amplitude_changed_cb)
+
+        # values are committed once editing is finished instead of on every keystroke
+        for spinbox in (self.source_frequency_input, self.source_x_input, self.source_y_input, self.phase_shift_input, self.amplitude_input):
+            spinbox.setKeyboardTracking(False)
+
+    @property
+    def source(self) -> SimulationSource | None:
+        return self._source
 
     def set_source(self, source: SimulationSource | None) -> None:
+        # edits still waiting in the throttled inputs belong to the previous source
+        self.flush()
         self._source = source
 
         if source is None:
             return
 
         self.source_name_label.setText(type(source).__name__)
-        self.source_frequency_input.setValue(source.frequency)
-        self.source_x_input.setValue(source.pos_x)
-        self.source_y_input.setValue(source.pos_y)
-        self.phase_shift_input.setValue(source.phase_shift)
-        self.amplitude_input.setValue(source.amplitude)
+
+        with (QtCore.QSignalBlocker(self.source_frequency_input),
+              QtCore.QSignalBlocker(self.source_x_input),
+              QtCore.QSignalBlocker(self.source_y_input),
+              QtCore.QSignalBlocker(self.phase_shift_input),
+              QtCore.QSignalBlocker(self.amplitude_input)):
+            self.source_frequency_input.setValue(source.frequency)
+            self.source_x_input.setValue(source.pos_x)
+            self.source_y_input.setValue(source.pos_y)
+            self.phase_shift_input.setValue(source.phase_shift)
+            self.amplitude_input.setValue(source.amplitude)
+
+    def flush(self) -> None:
+        for spinbox in (self.source_frequency_input, self.source_x_input, self.source_y_input, self.phase_shift_input, self.amplitude_input):
+            spinbox.flush()
 
     def set_max_source_pos(self, x: float | None, y: float | None) -> None:
         self.source_x_input.setMaximum(x if (x is not None) else self.source_x_input.value())
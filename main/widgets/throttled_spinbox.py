@@ -0,0 +1,39 @@
+from PyQt6.QtCore import QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtWidgets import QDoubleSpinBox, QWidget
+
+THROTTLE_INTERVAL_MS = 50
+
+class ThrottledSpinbox(QDoubleSpinBox):
+    # emitted at most once per throttle interval with the latest value
+    value_changed_throttled = pyqtSignal(float)
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+
+        self.valueChanged.connect(self._throttle_value_changed_cb)
+
+        self._pending_value = 0.0
+        self._has_pending_value = False
+        self._throttle_timer = QTimer(self)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.setInterval(THROTTLE_INTERVAL_MS)
+        self._throttle_timer.timeout.connect(self.flush)
+
+    def setValue(self, value: float) -> None:
+        # a pending user edit is delivered before it gets replaced programmatically
+        self.flush()
+        super().setValue(value)
+
+    @pyqtSlot()
+    def flush(self) -> None:
+        self._throttle_timer.stop()
+        if self._has_pending_value:
+            self._has_pending_value = False
+            self.value_changed_throttled.emit(self._pending_value)
+
+    @pyqtSlot(float)
+    def _throttle_value_changed_cb(self, new_value: float) -> None:
+        self._pending_value = new_value
+        self._has_pending_value = True
+        if not self._throttle_timer.isActive():
+            self._throttle_timer.start()